@@ -0,0 +1,13 @@
+"""Compile logic.py to a C extension with mypyc.
+
+Run `python build.py build_ext --inplace` from the repository root. The
+compiled module is placed next to logic.py and takes precedence when
+main.py imports `logic`; without it the pure-Python module is used.
+"""
+from setuptools import setup
+from mypyc.build import mypycify
+
+setup(
+    name="hex-slicer-logic",
+    ext_modules=mypycify(["logic.py"]),
+)
@@ -1,16 +1,133 @@
 import re
+import numpy as np
+import pandas as pd  # type: ignore[import-untyped]
+import pyarrow as pa  # type: ignore[import-untyped]
+
+_BYTE_BITS = [format(i, '08b') for i in range(256)]
+_HEX_RE = re.compile(r'[0-9a-f]*')
+_HEX_ONLY_DIGIT_RE = re.compile(r'[2-9a-f]')
 
 def hex_to_32bit_bin(hex_val) -> str:
     """Convert hex value to 32-bit binary string."""
+    hex_str = str(hex_val).strip().lower()
+    if hex_str.startswith("0x"):
+        hex_str = hex_str[2:]
+    if len(hex_str) <= 8:
+        # Parse exactly as the column conversion does, then expand each byte
+        word = _hex_to_u32(hex_str)
+        return ''.join([_BYTE_BITS[b] for b in word.to_bytes(4, 'big')])
+    # Oversized values keep every significant bit
     try:
-        hex_str = str(hex_val).strip().lower()
-        if hex_str.startswith("0x"):
-            hex_str = hex_str[2:]
-        hex_str = hex_str.zfill(8)
         return bin(int(hex_str, 16))[2:].zfill(32)
     except Exception:
         return "0" * 32
 
+def _hex_to_u32(hex_val) -> int:
+    """Convert hex value to an integer holding its leading 32 bits."""
+    hex_str = str(hex_val).strip().lower()
+    if hex_str.startswith("0x"):
+        hex_str = hex_str[2:]
+    try:
+        value = int(hex_str or "0", 16)
+    except ValueError:
+        return 0
+    if value < 0:
+        return 0
+    # Oversized values keep their leading bits, matching hex_to_32bit_bin
+    return value >> max(value.bit_length() - 32, 0)
+
+def hex_to_u32_array(hex_values) -> np.ndarray:
+    """Convert a Series of hex strings to a uint32 array."""
+    # Hex columns repeat heavily, so each distinct value is decoded once
+    codes, uniques = hex_values.factorize()
+    hex_strs = pd.Series(uniques).str.strip().str.lower().str.removeprefix('0x').str.zfill(8)
+    is_word = hex_strs.str.fullmatch(r'[0-9a-f]{8}').to_numpy(dtype=bool, na_value=False)
+    words = np.zeros(len(hex_strs), dtype=np.uint32)
+
+    # Decode all well-formed words from a single joined buffer
+    if is_word.any():
+        joined = ''.join(hex_strs[is_word].tolist())
+        words[is_word] = np.frombuffer(bytes.fromhex(joined), dtype='>u4')
+
+    # Invalid or oversized values take the scalar path
+    for i in np.flatnonzero(~is_word):
+        words[i] = _hex_to_u32(hex_strs.iat[i])
+
+    return words[codes]
+
+def binary_column_to_bitmatrix(bin_values, width: int) -> np.ndarray:
+    """
+    Convert a Series of binary strings to an (N, width) uint8 matrix of bits.
+
+    Values are zero-filled on the left and cut to width, like
+    slice_bits_custom does for a zero-filled string. Any character other
+    than '1' reads as a 0 bit.
+    """
+    if width == 0:
+        return np.zeros((len(bin_values), 0), dtype=np.uint8)
+    bin_strs = bin_values.str.replace(r'^0[xX]', '', regex=True).str.zfill(width).str.slice(0, width)
+    # Fixed-width unicode gives one uint32 code point per character
+    chars = np.array(bin_strs.tolist(), dtype=f'U{width}').view(np.uint32).reshape(-1, width)
+    return (chars == ord('1')).view(np.uint8)
+
+def bit_matrix_to_strings(bits: np.ndarray) -> np.ndarray:
+    """Render each row of a bit matrix as a binary string."""
+    width = bits.shape[1]
+    if width == 0:
+        return np.full(len(bits), '', dtype=object)
+    chars = np.ascontiguousarray(bits + ord('0'), dtype=np.uint8)
+    return chars.view(f'S{width}').ravel().astype(str).astype(object)
+
+def bit_matrix_to_ints(bits: np.ndarray) -> np.ndarray:
+    """Pack each row of a bit matrix of at most 32 columns into a uint32."""
+    weights = np.uint32(1) << np.arange(bits.shape[1] - 1, -1, -1, dtype=np.uint32)
+    return bits.astype(np.uint32) @ weights
+
+def slice_bits_u32(arr: np.ndarray, bit_assignments: list[int]) -> list[np.ndarray]:
+    """Slice 32-bit words into integer fields according to bit assignments."""
+    fields = []
+    start = 0
+
+    for bits in bit_assignments:
+        shift = 32 - start - bits
+        mask = (1 << bits) - 1
+        fields.append((arr >> np.uint32(shift)) & np.uint32(mask))
+        start += bits
+
+    return fields
+
+def format_bit_field(values: np.ndarray, bits: int) -> np.ndarray:
+    """Render integer bit fields as zero-padded binary strings."""
+    if bits == 0:
+        return np.full(len(values), '', dtype=object)
+    if bits <= 16:
+        # Small fields: index a table holding every possible string
+        table = np.array([format(i, f'0{bits}b') for i in range(1 << bits)], dtype=object)
+        return table[values]
+    words = values.astype('>u4')
+    bit_matrix = np.unpackbits(words.view(np.uint8)).reshape(-1, 32)
+    return bit_matrix_to_strings(bit_matrix[:, 32 - bits:])
+
+def bit_field_array(fields: np.ndarray, bits: int, rows: np.ndarray, n_rows: int) -> pa.DictionaryArray:
+    """
+    Build a dictionary-encoded column of binary strings for n_rows rows.
+
+    fields holds the values at the given row positions, either as integers
+    or as formatted strings; every other row is an empty string.
+    """
+    if fields.dtype != object and 0 < bits <= 16:
+        # The dictionary holds every possible value, so fields index it directly
+        dictionary = [format(i, f'0{bits}b') for i in range(1 << bits)] + ['']
+        indices = np.full(n_rows, 1 << bits, dtype=np.int32)
+        indices[rows] = fields
+        return pa.DictionaryArray.from_arrays(indices, pa.array(dictionary))
+
+    if fields.dtype != object:
+        fields = format_bit_field(fields, bits)
+    strings = np.full(n_rows, '', dtype=object)
+    strings[rows] = fields
+    return pa.array(strings, type=pa.string()).dictionary_encode()
+
 def is_likely_binary(value: str) -> bool:
     """
     Determine if a string is likely a binary string vs hex.
@@ -29,11 +146,11 @@ def is_likely_binary(value: str) -> bool:
         val_str = val_str[2:]
     
     # Check if all characters are valid hex
-    if not all(c in '0123456789abcdef' for c in val_str):
+    if not _HEX_RE.fullmatch(val_str):
         return False  # Not valid hex or binary
     
     # If it contains any hex digits (2-9, a-f), it's definitely hex
-    if any(c in '23456789abcdef' for c in val_str):
+    if _HEX_ONLY_DIGIT_RE.search(val_str):
         return False
     
     # At this point, it only contains 0s and 1s
@@ -63,12 +180,19 @@ def slice_bits_custom(bin_str: str, bit_assignments: list[int]) -> list[str]:
             slice_val = bin_str[start:] + '0' * (bits - remaining)
             slices.append(slice_val)
         else:
-            slice_val = bin_str[start:start + bits].zfill(bits)  # Force pad to required bit length
+            slice_val = bin_str[start:start + bits]  # Already exactly `bits` long
             slices.append(slice_val)
         start += bits
 
     return slices
 
+def bit_offsets(bit_assignments: list[int]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return the start, end and width of each bit assignment as int32 arrays."""
+    widths = np.asarray(bit_assignments, dtype=np.int32)
+    ends = np.cumsum(widths, dtype=np.int32)
+    starts = ends - widths
+    return starts, ends, widths
+
 def parse_bit_assignments(assignment_str: str) -> list[int]:
     """Parse comma-separated bit assignments string."""
     try:
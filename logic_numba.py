@@ -0,0 +1,25 @@
+from logic import slice_bits_u32
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+def _slice_fields_u32(vals, starts, widths, out):
+    """Slice each 32-bit word into fields, writing one field per column of out."""
+    # Rows are independent, so the outer loop is split across threads
+    for i in prange(len(vals)):
+        for k in range(len(widths)):
+            out[i, k] = (vals[i] >> (32 - starts[k] - widths[k])) & ((1 << widths[k]) - 1)
+
+def _slice_fields_u32_numpy(vals, starts, widths, out):
+    """NumPy equivalent of the compiled kernel, used when numba is unavailable."""
+    # starts is implied by widths, since fields are contiguous from bit 0
+    for k, field in enumerate(slice_bits_u32(vals, widths.tolist())):
+        out[:, k] = field
+
+if njit is not None:
+    slice_fields_u32 = njit(parallel=True, cache=True, boundscheck=False)(_slice_fields_u32)
+else:
+    slice_fields_u32 = _slice_fields_u32_numpy
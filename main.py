@@ -1,5 +1,11 @@
+import csv
+import logging
+import os
 import sys
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pacsv
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QPushButton, QLabel, QFileDialog,
     QComboBox, QSpinBox, QHBoxLayout, QMessageBox, QLineEdit,
@@ -7,10 +13,17 @@ from PySide6.QtWidgets import (
     QGroupBox, QHeaderView
 )
 from PySide6.QtCore import Qt
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from logic import (
-    hex_to_32bit_bin, detect_bit_length, slice_bits_custom,
-    parse_bit_assignments, generate_column_names, is_likely_binary
+    hex_to_32bit_bin, detect_bit_length, parse_bit_assignments,
+    generate_column_names, is_likely_binary, hex_to_u32_array,
+    binary_column_to_bitmatrix, bit_matrix_to_strings, bit_matrix_to_ints,
+    bit_field_array, bit_offsets
 )
+from logic_numba import slice_fields_u32
+
+logger = logging.getLogger(__name__)
 
 class HexSlicerApp(QWidget):
     def __init__(self):
@@ -21,6 +34,7 @@ class HexSlicerApp(QWidget):
         self.selected_column = None
         self.result_df = None
         self.binary_columns = set()  # Track columns that are known binary
+        self._bit_length_cache = {}  # Column name -> detected bit length
 
         layout = QVBoxLayout()
 
@@ -111,42 +125,38 @@ class HexSlicerApp(QWidget):
         if not file_path:
             return
 
+        # The whole sheet is parsed once here: openpyxl reads every cell even
+        # when usecols is given, so fetching columns on first use would cost a
+        # full parse per column, and a header-only read drops blank headers
         try:
-            df = pd.read_excel(file_path, engine="openpyxl", header=0, dtype=str)
+            df = self._read_excel(file_path, header=0)
             if not all(isinstance(c, str) for c in df.columns):
                 raise Exception("Header contains non-strings")
         except:
-            df = pd.read_excel(file_path, engine="openpyxl", header=None, dtype=str)
+            df = self._read_excel(file_path, header=None)
             df.columns = [f"Column_{i}" for i in range(len(df.columns))]
 
         self.df = df
         self.binary_columns = {col for col in df.columns if "_b" in col and "_bit" in col}
+        self._bit_length_cache.clear()
         self.file_label.setText(file_path.split("/")[-1])
         self.column_dropdown.clear()
         self.column_dropdown.addItems(df.columns)
         self.column_dropdown.setEnabled(True)
         self.preview_btn.setEnabled(True)
 
+    def _read_excel(self, file_path, **kwargs):
+        df = pd.read_excel(file_path, engine="openpyxl", dtype=str, **kwargs)
+        # Cast after reading: with dtype_backend="pyarrow", read_excel ignores
+        # dtype=str and fails on columns mixing numbers and text
+        return df.astype("string[pyarrow]")
+
     def on_column_changed(self):
         if self.df is None or not self.column_dropdown.currentText():
             return
 
         col_name = self.column_dropdown.currentText()
-        bit_length = 32  # Default
-        
-        for val in self.df[col_name]:
-            if pd.notna(val):
-                val_str = str(val).strip()
-                if col_name in self.binary_columns:
-                    # Column name indicates it's binary - trust the stored length
-                    bit_length = len(val_str)
-                elif is_likely_binary(val_str):
-                    # String looks like binary
-                    bit_length = len(val_str)
-                else:
-                    # It's hex - always 32 bits
-                    bit_length = 32
-                break
+        bit_length = self._detect_bit_length(col_name)
 
         self.bit_length_label.setText(f"Detected bit length: {bit_length}")
         self.slice_spin.setMaximum(max(bit_length - 1, 1))
@@ -176,18 +186,31 @@ class HexSlicerApp(QWidget):
         if self.df is None or not self.column_dropdown.currentText():
             return 32
             
-        col_name = self.column_dropdown.currentText()
-        for val in self.df[col_name]:
-            if pd.notna(val):
-                val_str = str(val).strip()
-                if col_name in self.binary_columns:
-                    return len(val_str)
-                elif is_likely_binary(val_str):
-                    return len(val_str)
-                else:
-                    # Hex is always 32-bit
-                    return 32
-        return 32
+        return self._detect_bit_length(self.column_dropdown.currentText())
+
+    def _first_value(self, col_name) -> str | None:
+        column = self.df[col_name]
+        first_index = column.first_valid_index()
+        return None if first_index is None else str(column.at[first_index]).strip()
+
+    def _is_binary_column(self, col_name) -> bool:
+        first_value = self._first_value(col_name)
+        return col_name in self.binary_columns or (
+            first_value is not None and is_likely_binary(first_value)
+        )
+
+    def _detect_bit_length(self, col_name):
+        if col_name in self._bit_length_cache:
+            return self._bit_length_cache[col_name]
+
+        bit_length = 32  # Default, and hex is always 32-bit
+        val_str = self._first_value(col_name)
+        if val_str is not None and self._is_binary_column(col_name):
+            # Binary column or binary-looking string - trust the stored length
+            bit_length = len(val_str)
+
+        self._bit_length_cache[col_name] = bit_length
+        return bit_length
 
     def preview_columns(self):
         bit_assignments = self.get_bit_assignments()
@@ -227,14 +250,18 @@ class HexSlicerApp(QWidget):
             return
 
         self.selected_column = self.column_dropdown.currentText()
-        self.df[self.selected_column] = self.df[self.selected_column].astype(str)
 
         bit_assignments = self.get_bit_assignments()
         if not bit_assignments:
             return
 
-        total_bits = sum(bit_assignments)
         expected_bits = self.get_current_bit_length()
+        if not all(0 <= bits <= expected_bits for bits in bit_assignments):
+            QMessageBox.warning(self, "Invalid Input", f"Each bit assignment must be between 0 and {expected_bits}")
+            return
+
+        starts, ends, widths = bit_offsets(bit_assignments)
+        total_bits = int(ends[-1])
 
         if total_bits != expected_bits:
             QMessageBox.warning(self, "Bit Count Mismatch", f"Total bits ({total_bits}) does not match column bit length ({expected_bits})")
@@ -245,39 +272,50 @@ class HexSlicerApp(QWidget):
             QMessageBox.warning(self, "Error", "Column names count mismatch")
             return
 
-        new_rows = []
-        debug_first = True
-        
-        for val in self.df[self.selected_column]:
-            if pd.notna(val):
-                val_str = str(val).strip()
-                
-                if self.selected_column in self.binary_columns:
-                    # Already binary from a previous slice
-                    bin_str = val_str.zfill(expected_bits)
-                elif is_likely_binary(val_str):
-                    # Binary string
-                    bin_str = val_str.zfill(expected_bits)
+        values = self.df[self.selected_column]
+        # A column is either binary or hex, so decide once from its first value
+        is_binary_column = self._is_binary_column(self.selected_column)
+        valid = values.notna().to_numpy()
+        rows = np.flatnonzero(valid)
+        val_strs = values[valid].str.strip()
+
+        if len(val_strs) and logger.isEnabledFor(logging.DEBUG):
+            val_str = val_strs.iloc[0]
+            bin_str = val_str.zfill(expected_bits) if is_binary_column else hex_to_32bit_bin(val_str)
+            logger.debug("Processing value: '%s'", val_str)
+            logger.debug("  Column: %s", self.selected_column)
+            logger.debug("  Is binary column: %s", is_binary_column)
+            logger.debug("  Binary result: '%s'", bin_str)
+            logger.debug("  Binary length: %d", len(bin_str))
+
+        # Each output column is dictionary-encoded: a field of w bits has at
+        # most 2**w distinct strings
+        arrays = []
+        if is_binary_column:
+            # Binary values are sliced from an (N, expected_bits) bit matrix
+            bits = binary_column_to_bitmatrix(val_strs, expected_bits)
+            # Python ints: a mypyc-compiled logic module rejects numpy scalars
+            for start, end, bits_count in zip(starts, ends, bit_assignments):
+                field_bits = bits[:, start:end]
+                if bits_count <= 16:
+                    fields = bit_matrix_to_ints(field_bits)
                 else:
-                    # Hex value - use the standard conversion
-                    bin_str = hex_to_32bit_bin(val_str)
-                
-                if debug_first:
-                    print(f"Debug - Processing value: '{val_str}'")
-                    print(f"  Column: {self.selected_column}")
-                    print(f"  Is binary column: {self.selected_column in self.binary_columns}")
-                    print(f"  is_likely_binary: {is_likely_binary(val_str)}")
-                    print(f"  Binary result: '{bin_str}'")
-                    print(f"  Binary length: {len(bin_str)}")
-                    debug_first = False
-                
-                sliced = slice_bits_custom(bin_str, bit_assignments)
-                new_rows.append(sliced)
-            else:
-                new_rows.append([''] * len(bit_assignments))
-
-        self.result_df = pd.DataFrame(new_rows, columns=column_names, dtype=object)
+                    fields = bit_matrix_to_strings(field_bits)
+                arrays.append(bit_field_array(fields, bits_count, rows, len(values)))
+        else:
+            # Hex values are always 32-bit words
+            words = hex_to_u32_array(val_strs)
+            fields = np.empty((len(words), len(widths)), dtype=np.uint32)
+            slice_fields_u32(words, starts, widths, fields)
+            # Python ints: a mypyc-compiled logic module rejects numpy scalars
+            for k, bits_count in enumerate(bit_assignments):
+                arrays.append(bit_field_array(fields[:, k], bits_count, rows, len(values)))
+
+        table = pa.Table.from_arrays(arrays, names=[str(name) for name in column_names])
+        self.result_df = table.to_pandas(types_mapper=pd.ArrowDtype)
         self.binary_columns.update(column_names)
+        for name in column_names:
+            self._bit_length_cache.pop(name, None)
         
         QMessageBox.information(self, "Done", f"Processed {len(self.result_df)} rows into {len(column_names)} columns.")
         self.save_btn.setEnabled(True)
@@ -286,21 +324,36 @@ class HexSlicerApp(QWidget):
         save_path, _ = QFileDialog.getSaveFileName(self, "Save File", "", "Excel (*.xlsx)")
         if save_path:
             try:
-                string_df = self.result_df.copy()
-                for col in string_df.columns:
-                    string_df[col] = string_df[col].astype(str)
-
-                with pd.ExcelWriter(save_path, engine='openpyxl') as writer:
-                    string_df.to_excel(writer, index=False, sheet_name='Sheet1')
-                    workbook = writer.book
-                    worksheet = writer.sheets['Sheet1']
-                    for row in range(2, len(string_df) + 2):
-                        for col in range(1, len(string_df.columns) + 1):
-                            cell = worksheet.cell(row=row, column=col)
-                            cell.number_format = '@'
+                workbook = Workbook(write_only=True)
+                worksheet = workbook.create_sheet('Sheet1')
+                worksheet.append([str(col) for col in self.result_df.columns])
+                for row in self.result_df.itertuples(index=False, name=None):
+                    cells = []
+                    for value in row:
+                        cell = WriteOnlyCell(worksheet, value=str(value))
+                        cell.number_format = '@'
+                        cells.append(cell)
+                    worksheet.append(cells)
+                workbook.save(save_path)
 
                 csv_path = save_path.replace('.xlsx', '.csv')
-                string_df.to_csv(csv_path, index=False)
+                if self.result_df.shape[1] == 1:
+                    # A lone empty field would be a blank line, which readers skip;
+                    # pandas writes it as "" instead
+                    self.result_df.to_csv(csv_path, index=False)
+                else:
+                    table = pa.Table.from_arrays(
+                        [pa.array(self.result_df.iloc[:, i]) for i in range(self.result_df.shape[1])],
+                        names=[str(col) for col in self.result_df.columns]
+                    )
+                    # Match pandas.to_csv: the header is quoted only where needed
+                    # by the csv module, and the 0/1 values never need it
+                    with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+                        csv.writer(f, lineterminator=os.linesep).writerow(table.column_names)
+                    with open(csv_path, 'ab') as f:
+                        pacsv.write_csv(table, f, pacsv.WriteOptions(
+                            include_header=False, quoting_style='none', eol=os.linesep
+                        ))
                 QMessageBox.information(self, "Saved", f"Files saved:\n{save_path}\n{csv_path}")
             except Exception as e:
                 QMessageBox.critical(self, "Error", str(e))
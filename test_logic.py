@@ -0,0 +1,91 @@
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from logic import (
+    hex_to_32bit_bin, hex_to_u32_array, slice_bits_custom, slice_bits_u32,
+    format_bit_field, binary_column_to_bitmatrix, bit_matrix_to_strings,
+    bit_matrix_to_ints, bit_offsets, bit_field_array
+)
+from logic_numba import _slice_fields_u32_numpy, slice_fields_u32
+
+# Field layouts covering 0-, 1-, 16-, 17- and 32-bit fields
+ASSIGNMENTS = [
+    [32], [0, 32], [1] * 32, [16, 16], [17, 15], [15, 17], [1, 16, 15], [8, 0, 24],
+]
+
+HEX_VALUES = [
+    '0', '0x1F', ' ABC ', 'ffffffff', '0XdeadBEEF', '', '0x', 'zz', '12 34',
+    '+1', 'ab_cd', '-1', '123456789', 'fffffffff1',
+]
+
+def random_words(n=500, seed=0):
+    rng = random.Random(seed)
+    return [rng.getrandbits(32) for _ in range(n)] + [0, 0xFFFFFFFF]
+
+def expected_slices(words, assignments):
+    return [slice_bits_custom(format(word, '032b'), assignments) for word in words]
+
+@pytest.mark.parametrize('assignments', ASSIGNMENTS)
+def test_slice_bits_u32_matches_slice_bits_custom(assignments):
+    words = random_words()
+    fields = slice_bits_u32(np.array(words, dtype=np.uint32), assignments)
+    columns = [format_bit_field(field, bits) for field, bits in zip(fields, assignments)]
+    assert [list(row) for row in zip(*columns)] == expected_slices(words, assignments)
+
+def test_hex_to_u32_array_matches_hex_to_32bit_bin():
+    words = hex_to_u32_array(pd.Series(HEX_VALUES))
+    assert words.dtype == np.uint32
+    for value, word in zip(HEX_VALUES, words):
+        # Oversized values keep their leading 32 bits
+        assert format(int(word), '032b') == hex_to_32bit_bin(value)[:32], value
+
+@pytest.mark.parametrize('kernel', [slice_fields_u32, _slice_fields_u32_numpy])
+@pytest.mark.parametrize('assignments', ASSIGNMENTS)
+def test_slice_fields_u32_matches_slice_bits_custom(kernel, assignments):
+    words = random_words()
+    starts = np.cumsum([0] + assignments[:-1], dtype=np.int32)
+    widths = np.asarray(assignments, dtype=np.int32)
+    fields = np.empty((len(words), len(widths)), dtype=np.uint32)
+    kernel(np.array(words, dtype=np.uint32), starts, widths, fields)
+    columns = [format_bit_field(fields[:, k], bits) for k, bits in enumerate(assignments)]
+    assert [list(row) for row in zip(*columns)] == expected_slices(words, assignments)
+
+@pytest.mark.parametrize('assignments', ASSIGNMENTS + [[20, 20], [0, 40, 0]])
+def test_binary_column_to_bitmatrix_matches_slice_bits_custom(assignments):
+    width = sum(assignments)
+    rng = random.Random(width)
+    # Short, exact and oversized values, some with a 0x prefix
+    values = [
+        ('0x' if i % 7 == 0 else '') + format(rng.getrandbits(width + 4), 'b')[:rng.randint(1, width + 4)]
+        for i in range(300)
+    ]
+    bits = binary_column_to_bitmatrix(pd.Series(values), width)
+    starts, ends, _ = bit_offsets(assignments)
+    columns = [bit_matrix_to_strings(bits[:, start:end]) for start, end in zip(starts, ends)]
+    expected = [slice_bits_custom(value.removeprefix('0x').zfill(width), assignments) for value in values]
+    assert [list(row) for row in zip(*columns)] == expected
+
+@pytest.mark.parametrize('bits', [0, 1, 16, 17, 32])
+@pytest.mark.parametrize('as_strings', [False, True])
+def test_bit_field_array_leaves_missing_rows_empty(bits, as_strings):
+    words = np.array(random_words(50), dtype=np.uint32)
+    fields = slice_bits_u32(words, [32 - bits, bits])[1]
+    expected_fields = format_bit_field(fields, bits)
+    if as_strings:
+        fields = expected_fields
+    # Every third row is missing
+    n_rows = len(words) * 3 // 2
+    rows = np.array([i for i in range(n_rows) if i % 3 != 2])
+    expected = [''] * n_rows
+    for row, value in zip(rows, expected_fields):
+        expected[row] = value
+    assert bit_field_array(fields, bits, rows, n_rows).to_pylist() == expected
+
+@pytest.mark.parametrize('width', [1, 16, 32])
+def test_bit_matrix_to_ints_matches_strings(width):
+    values = [format(word >> (32 - width), f'0{width}b') for word in random_words()]
+    bits = binary_column_to_bitmatrix(pd.Series(values), width)
+    assert [format(int(v), f'0{width}b') for v in bit_matrix_to_ints(bits)] == values